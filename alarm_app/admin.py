@@ -2,7 +2,13 @@
 Django admin configuration for Smart Alarm models.
 """
 
+from django import forms
 from django.contrib import admin
+from django.core.paginator import Paginator
+from django.db import connection
+from django.db.models import Prefetch
+from django.utils.functional import cached_property
+from .forms import RoutineDaysFormMixin
 from .models import (
     UserProfile,
     NewsSource,
@@ -14,6 +20,29 @@ from .models import (
 )
 
 
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator that estimates the row count from the PostgreSQL catalog
+    instead of running COUNT(*) over the whole table on every page load.
+
+    Falls back to an exact count on other backends (e.g. SQLite) or when
+    the estimate is unavailable.
+    """
+
+    @cached_property
+    def count(self):
+        if connection.vendor == "postgresql" and not self.object_list.query.where:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE relname = %s",
+                    [self.object_list.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+            if row and row[0] >= 0:
+                return row[0]
+        return super().count
+
+
 @admin.register(UserProfile)
 class UserProfileAdmin(admin.ModelAdmin):
     list_display = ["user_name", "default_location_name", "greeting_enabled"]
@@ -53,23 +82,56 @@ class WeatherLocationAdmin(admin.ModelAdmin):
 class QuoteAdmin(admin.ModelAdmin):
     list_display = ["text_preview", "author", "category", "active"]
     list_filter = ["category", "active"]
-    search_fields = ["text", "author"]
+    # Prefix match on author so the index is usable; quote text still needs
+    # a substring scan on SQLite (see get_search_results for PostgreSQL)
+    search_fields = ["text", "^author"]
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+    def get_search_results(self, request, queryset, search_term):
+        # On PostgreSQL use trigram similarity, which a pg_trgm GIN index
+        # can serve, instead of an unindexed ILIKE '%term%' table scan
+        if search_term and connection.vendor == "postgresql":
+            from django.db.models import Q
 
+            return (
+                queryset.filter(
+                    Q(text__trigram_similar=search_term)
+                    | Q(author__trigram_similar=search_term)
+                ),
+                False,
+            )
+        return super().get_search_results(request, queryset, search_term)
+
+    @admin.display(description="Quote")
     def text_preview(self, obj):
-        return obj.text[:100] + "..." if len(obj.text) > 100 else obj.text
+        text = obj.text
+        # text[100:101] is non-empty only when the string exceeds 100 chars
+        return text[:100] + "..." if text[100:101] else text
+
+
+class RoutineAdminForm(RoutineDaysFormMixin, forms.ModelForm):
+    """
+    Admin form exposing the days_mask bitmask as day checkboxes.
+    """
 
-    text_preview.short_description = "Quote"
+    class Meta:
+        model = Routine
+        fields = "__all__"
 
 
 @admin.register(Routine)
 class RoutineAdmin(admin.ModelAdmin):
+    form = RoutineAdminForm
     list_display = [
         "name",
         "enabled",
         "schedule_type",
         "time_of_day",
+        "scheduled_days",
         "last_run",
         "run_count",
+        "recent_log_status",
     ]
     list_filter = ["enabled", "schedule_type"]
     search_fields = ["name", "description"]
@@ -100,6 +162,35 @@ class RoutineAdmin(admin.ModelAdmin):
 
     readonly_fields = ["last_run", "run_count"]
 
+    def get_queryset(self, request):
+        # The changelist never renders these wide columns; the last few logs
+        # are prefetched in one bounded query instead of one per row
+        return (
+            super()
+            .get_queryset(request)
+            .defer("steps_json", "description")
+            .prefetch_related(
+                Prefetch(
+                    "logs",
+                    queryset=RoutineLog.objects.only(
+                        "id", "routine_id", "status", "started_at"
+                    ).order_by("-started_at")[:5],
+                    to_attr="recent_logs",
+                )
+            )
+        )
+
+    @admin.display(description="Days")
+    def scheduled_days(self, obj):
+        days = obj.get_scheduled_days()
+        return ", ".join(day[:3] for day in days) if days else "-"
+
+    @admin.display(description="Recent runs")
+    def recent_log_status(self, obj):
+        if not obj.recent_logs:
+            return "-"
+        return ", ".join(log.status for log in obj.recent_logs)
+
 
 @admin.register(AudioFile)
 class AudioFileAdmin(admin.ModelAdmin):
@@ -118,6 +209,9 @@ class RoutineLogAdmin(admin.ModelAdmin):
     ]
     list_filter = ["status", "started_at"]
     search_fields = ["routine__name"]
+    list_select_related = ["routine"]
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
     readonly_fields = [
         "routine",
         "started_at",
@@ -127,25 +221,32 @@ class RoutineLogAdmin(admin.ModelAdmin):
         "step_details",
     ]
 
+    def get_queryset(self, request):
+        # JOIN the routine in the main query instead of one SELECT per row,
+        # and skip step_details, which only the detail page renders
+        # (error_message stays: error_preview shows it in the changelist)
+        return (
+            super()
+            .get_queryset(request)
+            .select_related("routine")
+            .defer("step_details")
+        )
+
+    @admin.display(description="Duration")
     def duration_display(self, obj):
         duration = obj.duration_seconds()
         if duration:
             return f"{duration:.1f}s"
         return "-"
 
-    duration_display.short_description = "Duration"
-
+    @admin.display(description="Error")
     def error_preview(self, obj):
-        if obj.error_message:
-            return (
-                obj.error_message[:100] + "..."
-                if len(obj.error_message) > 100
-                else obj.error_message
-            )
+        message = obj.error_message
+        if message:
+            # message[100:101] is non-empty only when it exceeds 100 chars
+            return message[:100] + "..." if message[100:101] else message
         return "-"
 
-    error_preview.short_description = "Error"
-
     def has_add_permission(self, request):
         # Logs are created automatically, not manually
         return False
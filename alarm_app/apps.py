@@ -2,7 +2,40 @@
 Django app configuration for alarm_app.
 """
 
+import logging
+import sys
+import threading
+
 from django.apps import AppConfig
+from django.db.backends.signals import connection_created
+
+logger = logging.getLogger(__name__)
+
+# Set once the first database connection has been established
+_db_ready = threading.Event()
+_bootstrap_started = False
+
+# Long-running entry points that should load schedules on startup.
+# One-off management commands (migrate, shell, makemigrations, ...)
+# must not: the bootstrap would race migrate's DDL for SQLite's single
+# writer, or log spurious errors against a not-yet-migrated database.
+_BOOTSTRAP_COMMANDS = ("runserver", "runserver_with_worker", "qcluster")
+
+
+def _signal_db_ready(sender, connection, **kwargs):
+    _db_ready.set()
+
+
+def _bootstrap_schedules():
+    """Load all Django-Q routine schedules once the database is reachable."""
+    _db_ready.wait()
+    try:
+        from .scheduler import reload_all_schedules
+
+        reload_all_schedules()
+        logger.info("Django-Q schedules loaded")
+    except Exception as e:
+        logger.error(f"Failed to load schedules: {e}")
 
 
 class AlarmAppConfig(AppConfig):
@@ -13,7 +46,21 @@ class AlarmAppConfig(AppConfig):
     def ready(self):
         """
         Called when Django starts.
-        We DON'T start the scheduler here because it would access the database.
-        Instead, the scheduler is started via middleware on the first request.
+
+        Schedule loading needs the database, which isn't guaranteed to be
+        available yet, so we start a one-shot background thread that waits
+        for the first database connection before reloading schedules. This
+        replaces the old middleware that re-checked an init flag on every
+        request.
         """
-        pass
+        global _bootstrap_started
+        if _bootstrap_started:
+            return
+        if len(sys.argv) < 2 or sys.argv[1] not in _BOOTSTRAP_COMMANDS:
+            return
+        _bootstrap_started = True
+
+        connection_created.connect(_signal_db_ready, dispatch_uid="alarm_app_db_ready")
+        threading.Thread(
+            target=_bootstrap_schedules, name="schedule-bootstrap", daemon=True
+        ).start()
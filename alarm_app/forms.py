@@ -4,12 +4,78 @@ Django forms for the Smart Alarm application.
 
 from django import forms
 from django.core.exceptions import ValidationError
-import json
+import fastjsonschema
+import orjson
 
 from .models import Routine, UserProfile
 
+# Compiled once at import time; validates the steps array in C-backed code
+# instead of a per-step Python loop on every form save.
+_validate_steps = fastjsonschema.compile(
+    {
+        "type": "array",
+        "items": {
+            "type": "object",
+            "required": ["type"],
+            "properties": {
+                "type": {"type": "string"},
+                "config": {"type": "object"},
+            },
+        },
+    }
+)
+
+# Shared widget attrs, hoisted so every form declaration references the
+# same dicts instead of rebuilding identical copies
+_INPUT_STYLE = (
+    "width: 100%; padding: 0.75rem; border: 1px solid #ddd; "
+    "border-radius: 5px; font-size: 1rem;"
+)
+_TEXT_ATTRS = {"class": "form-control", "style": _INPUT_STYLE}
+_CHECKBOX_ATTRS = {"style": "width: 20px; height: 20px; cursor: pointer;"}
+
+# Day field names in bit order (bit 0=Monday ... bit 6=Sunday)
+DAY_FIELDS = (
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+    "sunday",
+)
+
+
+class RoutineDaysFormMixin(forms.Form):
+    """
+    Mixin exposing Routine.days_mask as seven day-of-week checkboxes.
+    """
+
+    _day_widget = forms.CheckboxInput(attrs=_CHECKBOX_ATTRS)
+
+    monday = forms.BooleanField(required=False, widget=_day_widget)
+    tuesday = forms.BooleanField(required=False, widget=_day_widget)
+    wednesday = forms.BooleanField(required=False, widget=_day_widget)
+    thursday = forms.BooleanField(required=False, widget=_day_widget)
+    friday = forms.BooleanField(required=False, widget=_day_widget)
+    saturday = forms.BooleanField(required=False, widget=_day_widget)
+    sunday = forms.BooleanField(required=False, widget=_day_widget)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        instance = getattr(self, "instance", None)
+        if instance is not None and instance.pk:
+            for i, name in enumerate(DAY_FIELDS):
+                self.fields[name].initial = bool(instance.days_mask >> i & 1)
+
+    def save(self, commit=True):
+        self.instance.days_mask = sum(
+            1 << i for i, name in enumerate(DAY_FIELDS) if self.cleaned_data.get(name)
+        )
+        return super().save(commit=commit)
 
-class RoutineForm(forms.ModelForm):
+
+class RoutineForm(RoutineDaysFormMixin, forms.ModelForm):
     """
     Form for creating and editing routines.
     """
@@ -23,71 +89,24 @@ class RoutineForm(forms.ModelForm):
             "schedule_type",
             "scheduled_datetime",
             "time_of_day",
-            "monday",
-            "tuesday",
-            "wednesday",
-            "thursday",
-            "friday",
-            "saturday",
-            "sunday",
             "steps_json",
         ]
         widgets = {
             "name": forms.TextInput(
-                attrs={
-                    "class": "form-control",
-                    "placeholder": "Morning Wake-up Routine",
-                    "style": "width: 100%; padding: 0.75rem; border: 1px solid #ddd; border-radius: 5px; font-size: 1rem;",
-                }
+                attrs={**_TEXT_ATTRS, "placeholder": "Morning Wake-up Routine"}
             ),
             "description": forms.Textarea(
                 attrs={
-                    "class": "form-control",
+                    **_TEXT_ATTRS,
                     "rows": 3,
                     "placeholder": "A comprehensive morning routine to start the day...",
-                    "style": "width: 100%; padding: 0.75rem; border: 1px solid #ddd; border-radius: 5px; font-size: 1rem;",
-                }
-            ),
-            "enabled": forms.CheckboxInput(
-                attrs={
-                    "style": "width: 20px; height: 20px; cursor: pointer;",
                 }
             ),
+            "enabled": forms.CheckboxInput(attrs=_CHECKBOX_ATTRS),
             "scheduled_datetime": forms.DateTimeInput(
-                attrs={
-                    "type": "datetime-local",
-                    "class": "form-control",
-                    "style": "width: 100%; padding: 0.75rem; border: 1px solid #ddd; border-radius: 5px; font-size: 1rem;",
-                }
-            ),
-            "time_of_day": forms.TimeInput(
-                attrs={
-                    "type": "time",
-                    "class": "form-control",
-                    "style": "width: 100%; padding: 0.75rem; border: 1px solid #ddd; border-radius: 5px; font-size: 1rem;",
-                }
-            ),
-            "monday": forms.CheckboxInput(
-                attrs={"style": "width: 20px; height: 20px; cursor: pointer;"}
-            ),
-            "tuesday": forms.CheckboxInput(
-                attrs={"style": "width: 20px; height: 20px; cursor: pointer;"}
-            ),
-            "wednesday": forms.CheckboxInput(
-                attrs={"style": "width: 20px; height: 20px; cursor: pointer;"}
-            ),
-            "thursday": forms.CheckboxInput(
-                attrs={"style": "width: 20px; height: 20px; cursor: pointer;"}
-            ),
-            "friday": forms.CheckboxInput(
-                attrs={"style": "width: 20px; height: 20px; cursor: pointer;"}
-            ),
-            "saturday": forms.CheckboxInput(
-                attrs={"style": "width: 20px; height: 20px; cursor: pointer;"}
-            ),
-            "sunday": forms.CheckboxInput(
-                attrs={"style": "width: 20px; height: 20px; cursor: pointer;"}
+                attrs={**_TEXT_ATTRS, "type": "datetime-local"}
             ),
+            "time_of_day": forms.TimeInput(attrs={**_TEXT_ATTRS, "type": "time"}),
             "steps_json": forms.HiddenInput(),
         }
 
@@ -100,24 +119,18 @@ class RoutineForm(forms.ModelForm):
         # If it's a string, try to parse it
         if isinstance(steps_json, str):
             try:
-                steps_json = json.loads(steps_json)
-            except json.JSONDecodeError:
+                steps_json = orjson.loads(steps_json)
+            except orjson.JSONDecodeError:
                 raise ValidationError("Invalid JSON format for steps")
 
-        # Ensure it's a list
-        if not isinstance(steps_json, list):
-            raise ValidationError("Steps must be a list")
-
-        # Validate each step
-        for i, step in enumerate(steps_json):
-            if not isinstance(step, dict):
-                raise ValidationError(f"Step {i+1} must be a dictionary")
+        # Validate the whole array with the precompiled schema
+        try:
+            _validate_steps(steps_json)
+        except fastjsonschema.JsonSchemaException as e:
+            raise ValidationError(f"Invalid steps configuration: {e.message}")
 
-            if "type" not in step:
-                raise ValidationError(f"Step {i+1} is missing 'type' field")
-
-            if "config" not in step:
-                step["config"] = {}
+        for step in steps_json:
+            step.setdefault("config", {})
 
         return steps_json
 
@@ -145,17 +158,7 @@ class RoutineForm(forms.ModelForm):
                 )
 
             # Check if at least one day is selected
-            days = [
-                cleaned_data.get("monday"),
-                cleaned_data.get("tuesday"),
-                cleaned_data.get("wednesday"),
-                cleaned_data.get("thursday"),
-                cleaned_data.get("friday"),
-                cleaned_data.get("saturday"),
-                cleaned_data.get("sunday"),
-            ]
-
-            if not any(days):
+            if not any(cleaned_data.get(day) for day in DAY_FIELDS):
                 raise ValidationError(
                     "At least one day of the week must be selected for recurring routines"
                 )
@@ -181,34 +184,16 @@ class UserProfileForm(forms.ModelForm):
         ]
         widgets = {
             "user_name": forms.TextInput(
-                attrs={
-                    "class": "form-control",
-                    "placeholder": "Your Name",
-                    "style": "width: 100%; padding: 0.75rem; border: 1px solid #ddd; border-radius: 5px; font-size: 1rem;",
-                }
+                attrs={**_TEXT_ATTRS, "placeholder": "Your Name"}
             ),
             "default_location_name": forms.TextInput(
-                attrs={
-                    "class": "form-control",
-                    "placeholder": "Johnson City, TN",
-                    "style": "width: 100%; padding: 0.75rem; border: 1px solid #ddd; border-radius: 5px; font-size: 1rem;",
-                }
+                attrs={**_TEXT_ATTRS, "placeholder": "Johnson City, TN"}
             ),
             "default_latitude": forms.NumberInput(
-                attrs={
-                    "class": "form-control",
-                    "placeholder": "36.3406",
-                    "step": "0.000001",
-                    "style": "width: 100%; padding: 0.75rem; border: 1px solid #ddd; border-radius: 5px; font-size: 1rem;",
-                }
+                attrs={**_TEXT_ATTRS, "placeholder": "36.3406", "step": "0.000001"}
             ),
             "default_longitude": forms.NumberInput(
-                attrs={
-                    "class": "form-control",
-                    "placeholder": "-82.3804",
-                    "step": "0.000001",
-                    "style": "width: 100%; padding: 0.75rem; border: 1px solid #ddd; border-radius: 5px; font-size: 1rem;",
-                }
+                attrs={**_TEXT_ATTRS, "placeholder": "-82.3804", "step": "0.000001"}
             ),
             "tts_command": forms.TextInput(
                 attrs={
@@ -216,14 +201,8 @@ class UserProfileForm(forms.ModelForm):
                     "style": "width: 100%; padding: 0.75rem; border: 1px solid #ddd; border-radius: 5px; font-family: monospace; font-size: 0.95rem;",
                 }
             ),
-            "greeting_enabled": forms.CheckboxInput(
-                attrs={"style": "width: 20px; height: 20px; cursor: pointer;"}
-            ),
+            "greeting_enabled": forms.CheckboxInput(attrs=_CHECKBOX_ATTRS),
             "greeting_text": forms.TextInput(
-                attrs={
-                    "class": "form-control",
-                    "placeholder": "Good morning, {name}!",
-                    "style": "width: 100%; padding: 0.75rem; border: 1px solid #ddd; border-radius: 5px; font-size: 1rem;",
-                }
+                attrs={**_TEXT_ATTRS, "placeholder": "Good morning, {name}!"}
             ),
         }
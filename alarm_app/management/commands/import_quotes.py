@@ -10,6 +10,23 @@ from alarm_app.models import Quote
 import os
 
 
+def iter_quote_blocks(f):
+    """Yield quote blocks from a file, splitting on '----' delimiter lines.
+
+    Streams the file line by line so memory use is bounded by the largest
+    single quote rather than the whole file.
+    """
+    buf = []
+    for line in f:
+        if line.rstrip("\n") == "----":
+            yield "".join(buf)
+            buf.clear()
+        else:
+            buf.append(line)
+    if buf:
+        yield "".join(buf)
+
+
 class Command(BaseCommand):
     help = 'Import quotes from a text file (format: quote text followed by "----" separator)'
 
@@ -42,47 +59,53 @@ class Command(BaseCommand):
             Quote.objects.all().delete()
             self.stdout.write(self.style.WARNING(f"Deleted {count} existing quotes"))
 
-        # Read and parse the file
+        # Load all existing quote texts once instead of querying per quote
+        existing_texts = set(Quote.objects.values_list("text", flat=True))
+
+        to_create = []
+        skipped_count = 0
+
+        # Stream the file block by block instead of reading it all into RAM
         try:
             with open(file_path, "r", encoding="utf-8") as f:
-                content = f.read()
+                for quote_text in iter_quote_blocks(f):
+                    quote_text = quote_text.strip()
+
+                    # Skip empty quotes
+                    if not quote_text:
+                        continue
+
+                    # Try to extract author (last line if it doesn't end with punctuation)
+                    lines = quote_text.split("\n")
+                    author = ""
+
+                    if len(lines) > 1:
+                        last_line = lines[-1].strip()
+                        # If last line looks like an author attribution
+                        if last_line and not last_line[-1] in ".!?":
+                            author = last_line
+                            quote_text = "\n".join(lines[:-1]).strip()
+
+                    # Check if quote already exists (also catches duplicates within the file)
+                    if quote_text in existing_texts:
+                        skipped_count += 1
+                        continue
+
+                    existing_texts.add(quote_text)
+                    to_create.append(
+                        Quote(
+                            text=quote_text,
+                            author=author,
+                            category=category,
+                            active=True,
+                        )
+                    )
         except Exception as e:
             raise CommandError(f"Error reading file: {e}")
 
-        # Split by separator
-        quotes_raw = content.split("----\n")
-
-        imported_count = 0
-        skipped_count = 0
-
-        for quote_text in quotes_raw:
-            quote_text = quote_text.strip()
-
-            # Skip empty quotes
-            if not quote_text:
-                continue
-
-            # Try to extract author (last line if it doesn't end with punctuation)
-            lines = quote_text.split("\n")
-            author = ""
-
-            if len(lines) > 1:
-                last_line = lines[-1].strip()
-                # If last line looks like an author attribution
-                if last_line and not last_line[-1] in ".!?":
-                    author = last_line
-                    quote_text = "\n".join(lines[:-1]).strip()
-
-            # Check if quote already exists
-            if Quote.objects.filter(text=quote_text).exists():
-                skipped_count += 1
-                continue
-
-            # Create the quote
-            Quote.objects.create(
-                text=quote_text, author=author, category=category, active=True
-            )
-            imported_count += 1
+        # Insert all new quotes in batches
+        Quote.objects.bulk_create(to_create, batch_size=500, ignore_conflicts=True)
+        imported_count = len(to_create)
 
         # Summary
         self.stdout.write(
@@ -8,6 +8,7 @@ Usage:
 
 from django.core.management.base import BaseCommand
 from django.core.management import call_command
+import selectors
 import subprocess
 import sys
 import signal
@@ -35,8 +36,6 @@ class Command(BaseCommand):
             [sys.executable, 'manage.py', 'qcluster'],
             stdout=subprocess.PIPE,
             stderr=subprocess.STDOUT,
-            universal_newlines=True,
-            bufsize=1
         )
         
         self.stdout.write(self.style.SUCCESS(f'✓ Django-Q worker started (PID: {qcluster_process.pid})'))
@@ -52,12 +51,43 @@ class Command(BaseCommand):
         signal.signal(signal.SIGINT, signal_handler)
         signal.signal(signal.SIGTERM, signal_handler)
         
-        # Print qcluster output in background
+        # Print qcluster output in background. Nonblocking chunked reads let
+        # log bursts be flushed with one write instead of one per line.
         import threading
         def print_qcluster_output():
-            for line in qcluster_process.stdout:
-                self.stdout.write(self.style.SUCCESS(f'[Q] {line.rstrip()}'))
-        
+            fd = qcluster_process.stdout.fileno()
+            os.set_blocking(fd, False)
+            selector = selectors.DefaultSelector()
+            selector.register(fd, selectors.EVENT_READ)
+            buf = bytearray()
+
+            def flush(lines):
+                text = '\n'.join(
+                    '[Q] ' + line.decode(errors='replace').rstrip() for line in lines
+                )
+                self.stdout.write(self.style.SUCCESS(text))
+
+            while True:
+                if not selector.select(timeout=1):
+                    if qcluster_process.poll() is not None:
+                        break
+                    continue
+                try:
+                    chunk = os.read(fd, 65536)
+                except BlockingIOError:
+                    continue
+                if not chunk:
+                    break
+                buf += chunk
+                lines = buf.split(b'\n')
+                buf = bytearray(lines.pop())  # keep any partial trailing line
+                if lines:
+                    flush(lines)
+
+            if buf:
+                flush([bytes(buf)])
+            selector.close()
+
         thread = threading.Thread(target=print_qcluster_output, daemon=True)
         thread.start()
         
@@ -0,0 +1,58 @@
+# Pack the seven per-day boolean columns into a single days_mask bitmask
+# (bit 0=Monday ... bit 6=Sunday).
+
+from django.db import migrations, models
+
+DAY_COLUMNS = (
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+    "sunday",
+)
+
+
+def pack_days_mask(apps, schema_editor):
+    Routine = apps.get_model("alarm_app", "Routine")
+    routines = []
+    for routine in Routine.objects.all():
+        routine.days_mask = sum(
+            1 << i for i, name in enumerate(DAY_COLUMNS) if getattr(routine, name)
+        )
+        routines.append(routine)
+    Routine.objects.bulk_update(routines, ["days_mask"], batch_size=200)
+
+
+def unpack_days_mask(apps, schema_editor):
+    Routine = apps.get_model("alarm_app", "Routine")
+    routines = []
+    for routine in Routine.objects.all():
+        for i, name in enumerate(DAY_COLUMNS):
+            setattr(routine, name, bool(routine.days_mask >> i & 1))
+        routines.append(routine)
+    Routine.objects.bulk_update(routines, list(DAY_COLUMNS), batch_size=200)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("alarm_app", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="routine",
+            name="days_mask",
+            field=models.PositiveSmallIntegerField(default=0),
+        ),
+        migrations.RunPython(pack_days_mask, unpack_days_mask),
+        migrations.RemoveField(model_name="routine", name="monday"),
+        migrations.RemoveField(model_name="routine", name="tuesday"),
+        migrations.RemoveField(model_name="routine", name="wednesday"),
+        migrations.RemoveField(model_name="routine", name="thursday"),
+        migrations.RemoveField(model_name="routine", name="friday"),
+        migrations.RemoveField(model_name="routine", name="saturday"),
+        migrations.RemoveField(model_name="routine", name="sunday"),
+    ]
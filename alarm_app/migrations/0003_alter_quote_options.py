@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-30 10:27
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('alarm_app', '0002_routine_days_mask'),
+    ]
+
+    operations = [
+        migrations.AlterModelOptions(
+            name='quote',
+            options={},
+        ),
+    ]
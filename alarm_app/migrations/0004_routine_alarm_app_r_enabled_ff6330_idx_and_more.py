@@ -0,0 +1,33 @@
+# Generated by Django 5.2.17 on 2026-08-30 10:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('alarm_app', '0003_alter_quote_options'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='routine',
+            index=models.Index(fields=['enabled', 'schedule_type'], name='alarm_app_r_enabled_ff6330_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='routine',
+            index=models.Index(fields=['scheduled_datetime'], name='alarm_app_r_schedul_ed6b2e_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='routinelog',
+            index=models.Index(fields=['-started_at'], name='alarm_app_r_started_9555ba_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='routinelog',
+            index=models.Index(fields=['routine', '-started_at'], name='alarm_app_r_routine_449b1f_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='routinelog',
+            index=models.Index(fields=['status', '-started_at'], name='alarm_app_r_status_fb9bc0_idx'),
+        ),
+    ]
@@ -0,0 +1,53 @@
+# Convert Routine.steps_json from a plain JSON column to zlib-compressed
+# orjson bytes (CompressedJSONField). Existing values are copied through a
+# temporary column so the data is recompressed in place.
+
+from django.db import migrations
+
+import alarm_app.models
+
+
+def compress_steps(apps, schema_editor):
+    Routine = apps.get_model("alarm_app", "Routine")
+    routines = []
+    for routine in Routine.objects.all():
+        routine.steps_data = routine.steps_json
+        routines.append(routine)
+    Routine.objects.bulk_update(routines, ["steps_data"], batch_size=200)
+
+
+def decompress_steps(apps, schema_editor):
+    Routine = apps.get_model("alarm_app", "Routine")
+    routines = []
+    for routine in Routine.objects.all():
+        routine.steps_json = routine.steps_data
+        routines.append(routine)
+    Routine.objects.bulk_update(routines, ["steps_json"], batch_size=200)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("alarm_app", "0004_routine_alarm_app_r_enabled_ff6330_idx_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="routine",
+            name="steps_data",
+            field=alarm_app.models.CompressedJSONField(null=True),
+        ),
+        migrations.RunPython(compress_steps, decompress_steps),
+        migrations.RemoveField(model_name="routine", name="steps_json"),
+        migrations.RenameField(
+            model_name="routine", old_name="steps_data", new_name="steps_json"
+        ),
+        migrations.AlterField(
+            model_name="routine",
+            name="steps_json",
+            field=alarm_app.models.CompressedJSONField(
+                default=list,
+                help_text="List of step configurations in JSON format",
+            ),
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.17 on 2026-08-30 10:32
+
+import alarm_app.models
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('alarm_app', '0005_routine_steps_json_compressed'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='routinelog',
+            name='step_details',
+            field=models.JSONField(decoder=alarm_app.models.OrjsonDecoder, default=dict, encoder=alarm_app.models.OrjsonEncoder, help_text="Details about each step's execution"),
+        ),
+    ]
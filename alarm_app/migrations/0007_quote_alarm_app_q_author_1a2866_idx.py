@@ -0,0 +1,41 @@
+# Generated by Django 5.2.17 on 2026-08-30 10:33
+
+from django.db import migrations, models
+
+
+def create_trigram_indexes(apps, schema_editor):
+    # Only PostgreSQL has pg_trgm; the admin search falls back to LIKE on
+    # other backends
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS alarm_app_quote_text_trgm "
+        "ON alarm_app_quote USING gin (text gin_trgm_ops)"
+    )
+    schema_editor.execute(
+        "CREATE INDEX IF NOT EXISTS alarm_app_quote_author_trgm "
+        "ON alarm_app_quote USING gin (author gin_trgm_ops)"
+    )
+
+
+def drop_trigram_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("DROP INDEX IF EXISTS alarm_app_quote_text_trgm")
+    schema_editor.execute("DROP INDEX IF EXISTS alarm_app_quote_author_trgm")
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('alarm_app', '0006_alter_routinelog_step_details'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='quote',
+            index=models.Index(fields=['author'], name='alarm_app_q_author_1a2866_idx'),
+        ),
+        migrations.RunPython(create_trigram_indexes, drop_trigram_indexes),
+    ]
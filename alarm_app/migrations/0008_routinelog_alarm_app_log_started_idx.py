@@ -0,0 +1,17 @@
+# Generated by Django 5.2.17 on 2026-08-30 10:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('alarm_app', '0007_quote_alarm_app_q_author_1a2866_idx'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='routinelog',
+            index=models.Index(condition=models.Q(('status', 'started')), fields=['routine'], name='alarm_app_log_started_idx'),
+        ),
+    ]
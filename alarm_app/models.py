@@ -2,10 +2,108 @@
 Django models for Smart Alarm application.
 """
 
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
 from django.db import models
 from django.core.validators import MinValueValidator, MaxValueValidator
 from django.utils import timezone
+from django.utils.functional import cached_property
+from string import Template
 import json
+import orjson
+import random
+import zlib
+
+# Day names indexed by bit position in Routine.days_mask (0=Monday, 6=Sunday)
+DAY_NAMES = (
+    "Monday",
+    "Tuesday",
+    "Wednesday",
+    "Thursday",
+    "Friday",
+    "Saturday",
+    "Sunday",
+)
+
+
+class OrjsonEncoder(DjangoJSONEncoder):
+    """
+    JSONField encoder that serializes through orjson, falling back to
+    DjangoJSONEncoder for types orjson doesn't handle (e.g. Decimal).
+    """
+
+    def encode(self, o):
+        try:
+            return orjson.dumps(o).decode()
+        except TypeError:
+            return super().encode(o)
+
+
+class OrjsonDecoder(json.JSONDecoder):
+    """JSONField decoder that parses through orjson."""
+
+    def decode(self, s, *args, **kwargs):
+        return orjson.loads(s)
+
+
+class CompressedJSONField(models.BinaryField):
+    """
+    JSON stored as zlib-compressed orjson bytes.
+
+    Step arrays compress several-fold, keeping Routine rows narrow on disk
+    and on the wire while Python code still sees plain lists/dicts.
+    """
+
+    description = "zlib-compressed JSON"
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault("editable", True)
+        super().__init__(*args, **kwargs)
+
+    def from_db_value(self, value, expression, connection):
+        if value is None:
+            return None
+        return orjson.loads(zlib.decompress(bytes(value)))
+
+    def to_python(self, value):
+        if value is None or isinstance(value, (list, dict)):
+            return value
+        if isinstance(value, str):
+            return orjson.loads(value)
+        return orjson.loads(zlib.decompress(bytes(value)))
+
+    def get_prep_value(self, value):
+        if value is None or isinstance(value, (bytes, memoryview)):
+            return value
+        return zlib.compress(orjson.dumps(value))
+
+    def formfield(self, **kwargs):
+        from django import forms as form_fields
+
+        return super().formfield(**{"form_class": form_fields.JSONField, **kwargs})
+
+
+# Scheduled-day name tuples for every possible days_mask value, computed
+# once at import instead of per call
+_SCHEDULED_DAYS_BY_MASK = tuple(
+    tuple(name for i, name in enumerate(DAY_NAMES) if mask >> i & 1)
+    for mask in range(128)
+)
+
+
+def _day_flag(bit):
+    """Build a property exposing one bit of Routine.days_mask as a boolean."""
+
+    def getter(self):
+        return bool(self.days_mask >> bit & 1)
+
+    def setter(self, value):
+        if value:
+            self.days_mask |= 1 << bit
+        else:
+            self.days_mask &= ~(1 << bit)
+
+    return property(getter, setter)
 
 
 class UserProfile(models.Model):
@@ -13,6 +111,9 @@ class UserProfile(models.Model):
     User profile storing default settings and preferences.
     """
 
+    # Cache key for the singleton profile
+    PROFILE_CACHE_KEY = "user_profile:1"
+
     # Singleton pattern - only one profile per system
     user_name = models.CharField(max_length=100, default="User")
 
@@ -50,11 +151,45 @@ class UserProfile(models.Model):
     def __str__(self):
         return f"Profile for {self.user_name}"
 
+    def save(self, *args, **kwargs):
+        super().save(*args, **kwargs)
+        # Invalidate the cached singleton and compiled templates so readers
+        # see the new settings
+        cache.delete(self.PROFILE_CACHE_KEY)
+        self.__dict__.pop("_tts_template", None)
+        self.__dict__.pop("_greeting_template", None)
+
+    @cached_property
+    def _tts_template(self):
+        """Compiled TTS command template, parsed once per profile load."""
+        return Template(self.tts_command.replace("{text}", "$text"))
+
+    @cached_property
+    def _greeting_template(self):
+        """Compiled greeting template, parsed once per profile load."""
+        return Template(self.greeting_text.replace("{name}", "$name"))
+
+    def render_tts(self, text):
+        """Render the TTS command for the given text."""
+        return self._tts_template.substitute(text=text)
+
+    def render_greeting(self, name=None):
+        """Render the greeting for the given (or profile) user name."""
+        return self._greeting_template.substitute(name=name or self.user_name)
+
     @classmethod
     def get_profile(cls):
-        """Get or create the singleton profile."""
-        profile, created = cls.objects.get_or_create(pk=1)
-        return profile
+        """
+        Get or create the singleton profile.
+
+        Cached for five minutes; save() invalidates eagerly, so the TTL
+        is only a safety net and dashboard hits skip the SELECT.
+        """
+        return cache.get_or_set(
+            cls.PROFILE_CACHE_KEY,
+            lambda: cls.objects.get_or_create(pk=1)[0],
+            timeout=300,
+        )
 
 
 class NewsSource(models.Model):
@@ -117,8 +252,14 @@ class Quote(models.Model):
 
     created_at = models.DateTimeField(auto_now_add=True)
 
+    # Cache key for the list of active quote ids
+    ACTIVE_IDS_CACHE_KEY = "quote:active_ids"
+
     class Meta:
-        ordering = ["?"]  # Random ordering for variety
+        indexes = [
+            # Admin search prefix-matches on author
+            models.Index(fields=["author"]),
+        ]
 
     def __str__(self):
         if self.author:
@@ -127,8 +268,28 @@ class Quote(models.Model):
 
     @classmethod
     def get_random_quote(cls):
-        """Get a random active quote."""
-        return cls.objects.filter(active=True).order_by("?").first()
+        """Get a random active quote.
+
+        Picks a random id from a cached id list instead of ORDER BY RANDOM(),
+        which sorts the whole table on every call.
+        """
+        for _ in range(2):
+            ids = cache.get_or_set(
+                cls.ACTIVE_IDS_CACHE_KEY,
+                lambda: list(
+                    cls.objects.filter(active=True).values_list("id", flat=True)
+                ),
+                timeout=300,
+            )
+            if not ids:
+                return None
+            quote = cls.objects.filter(pk=random.choice(ids), active=True).first()
+            if quote is not None:
+                return quote
+            # The picked quote was deleted or deactivated within the TTL:
+            # drop the stale id list and retry against a fresh one
+            cache.delete(cls.ACTIVE_IDS_CACHE_KEY)
+        return None
 
 
 class Routine(models.Model):
@@ -139,9 +300,9 @@ class Routine(models.Model):
     name = models.CharField(max_length=200)
     description = models.TextField(blank=True)
 
-    # Steps stored as JSON
+    # Steps stored as compressed JSON
     # Format: [{'type': 'alarm', 'config': {...}}, ...]
-    steps_json = models.JSONField(
+    steps_json = CompressedJSONField(
         default=list, help_text="List of step configurations in JSON format"
     )
 
@@ -165,14 +326,19 @@ class Routine(models.Model):
         null=True, blank=True, help_text="Time of day for recurring execution"
     )
 
-    # Days of week for recurring schedules (0=Monday, 6=Sunday)
-    monday = models.BooleanField(default=False)
-    tuesday = models.BooleanField(default=False)
-    wednesday = models.BooleanField(default=False)
-    thursday = models.BooleanField(default=False)
-    friday = models.BooleanField(default=False)
-    saturday = models.BooleanField(default=False)
-    sunday = models.BooleanField(default=False)
+    # Days of week for recurring schedules, packed as a bitmask
+    # (bit 0=Monday ... bit 6=Sunday)
+    days_mask = models.PositiveSmallIntegerField(default=0)
+
+    # Per-day boolean accessors so callers (scheduler, templates) can keep
+    # reading/writing routine.monday etc. against the bitmask
+    monday = _day_flag(0)
+    tuesday = _day_flag(1)
+    wednesday = _day_flag(2)
+    thursday = _day_flag(3)
+    friday = _day_flag(4)
+    saturday = _day_flag(5)
+    sunday = _day_flag(6)
 
     # Tracking
     last_run = models.DateTimeField(null=True, blank=True)
@@ -183,26 +349,18 @@ class Routine(models.Model):
 
     class Meta:
         ordering = ["-created_at"]
+        indexes = [
+            # Scheduler bootstrap filters on enabled/schedule_type
+            models.Index(fields=["enabled", "schedule_type"]),
+            models.Index(fields=["scheduled_datetime"]),
+        ]
 
     def __str__(self):
         return self.name
 
     def get_scheduled_days(self):
-        """Get list of day names when this routine is scheduled."""
-        days = []
-        day_mapping = [
-            (self.monday, "Monday"),
-            (self.tuesday, "Tuesday"),
-            (self.wednesday, "Wednesday"),
-            (self.thursday, "Thursday"),
-            (self.friday, "Friday"),
-            (self.saturday, "Saturday"),
-            (self.sunday, "Sunday"),
-        ]
-        for enabled, name in day_mapping:
-            if enabled:
-                days.append(name)
-        return days
+        """Get day names when this routine is scheduled (precomputed lookup)."""
+        return _SCHEDULED_DAYS_BY_MASK[self.days_mask & 0x7F]
 
     def is_scheduled_today(self):
         """Check if routine is scheduled for today."""
@@ -214,24 +372,19 @@ class Routine(models.Model):
                 return self.scheduled_datetime.date() == timezone.now().date()
             return False
 
-        # Recurring schedule
-        weekday = timezone.now().weekday()  # 0=Monday, 6=Sunday
-        day_flags = [
-            self.monday,
-            self.tuesday,
-            self.wednesday,
-            self.thursday,
-            self.friday,
-            self.saturday,
-            self.sunday,
-        ]
-        return day_flags[weekday]
+        # Recurring schedule: test the bit for today's weekday (0=Monday)
+        return bool(self.days_mask >> timezone.now().weekday() & 1)
 
     def mark_as_run(self):
         """Mark this routine as having been run."""
-        self.last_run = timezone.now()
+        now = timezone.now()
+        # Single atomic UPDATE; F() avoids the read-modify-write race when
+        # runs overlap
+        Routine.objects.filter(pk=self.pk).update(
+            last_run=now, run_count=models.F("run_count") + 1
+        )
+        self.last_run = now
         self.run_count += 1
-        self.save(update_fields=["last_run", "run_count"])
 
     def to_routine_config(self):
         """Convert to format expected by Routine class."""
@@ -284,11 +437,27 @@ class RoutineLog(models.Model):
 
     # Details about each step execution
     step_details = models.JSONField(
-        default=dict, help_text="Details about each step's execution"
+        default=dict,
+        encoder=OrjsonEncoder,
+        decoder=OrjsonDecoder,
+        help_text="Details about each step's execution",
     )
 
     class Meta:
         ordering = ["-started_at"]
+        indexes = [
+            # Admin changelist and recent-logs queries order by -started_at
+            models.Index(fields=["-started_at"]),
+            models.Index(fields=["routine", "-started_at"]),
+            models.Index(fields=["status", "-started_at"]),
+            # Partial index serving the scheduler's single-flight probe;
+            # only in-progress rows are indexed, so it stays tiny
+            models.Index(
+                fields=["routine"],
+                condition=models.Q(status="started"),
+                name="alarm_app_log_started_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"{self.routine.name} - {self.started_at.strftime('%Y-%m-%d %H:%M')} - {self.status}"
@@ -2,14 +2,38 @@
 Routine class for managing and executing sequences of RoutineSteps.
 """
 
+import functools
+import logging
 import threading
-import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import List, Dict, Any, Optional
 from datetime import datetime
 import json
 
 from .routine_steps import create_routine_step, RoutineStep
 
+log = logging.getLogger(__name__)
+
+# orjson (C-implemented) when available, stdlib json otherwise
+try:
+    import orjson
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+
+    _loads = orjson.loads
+except ImportError:
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj, indent=2)
+
+    _loads = json.loads
+
+# One process-wide pool for step prefetches: worker threads are spawned
+# once and reused, instead of creating and tearing down a pool (and its
+# OS threads) on every routine run
+_PREFETCH_POOL = ThreadPoolExecutor(max_workers=4, thread_name_prefix="prefetch")
+
 
 class Routine:
     """
@@ -19,9 +43,12 @@ class Routine:
     Only one routine can execute at a time (mutual exclusion).
     """
 
-    # Class-level lock for mutual exclusion
-    _execution_lock = threading.Lock()
-    _currently_running = None
+    # Per-scope locks for mutual exclusion: routines on independent scopes
+    # (e.g. different audio devices) run in parallel, while the default
+    # "global" scope keeps the old one-routine-at-a-time behavior
+    _locks: Dict[str, threading.Lock] = {}
+    _locks_guard = threading.Lock()
+    _currently_running: Dict[str, str] = {}
 
     def __init__(
         self,
@@ -45,45 +72,77 @@ class Routine:
         self.steps: List[RoutineStep] = []
         self._stop_event = threading.Event()
         self._execution_thread = None
+        self._scope = "global"
+        self._json_cache: Optional[str] = None
 
         # Build the steps from configuration
         self._build_steps()
 
     def _build_steps(self):
-        """Build RoutineStep instances from configuration."""
+        """Build RoutineStep instances from configuration, validating as we go."""
         self.steps = []
-        for step_config in self.steps_config:
+        self._build_errors: List[str] = []
+
+        if not self.name:
+            self._build_errors.append("Routine name is required")
+        if not self.steps_config:
+            self._build_errors.append("Routine must have at least one step")
+
+        for i, step_config in enumerate(self.steps_config, 1):
             step_type = step_config.get("type")
             step_params = step_config.get("config", {})
 
             step = create_routine_step(step_type, step_params)
             if step:
+                # Validate here so validate() is a plain attribute read and
+                # unknown types surface as errors, not dropped warnings
+                is_valid, error = step.validate_config()
+                if not is_valid:
+                    self._build_errors.append(
+                        f"Step {i} ({step.__class__.__name__}): {error}"
+                    )
                 self.steps.append(step)
             else:
-                print(
-                    f"Warning: Unknown step type '{step_type}' in routine '{self.name}'"
-                )
+                self._build_errors.append(f"Step {i}: unknown step type '{step_type}'")
+
+        # Execution plan resolved once at build time: bound execute methods
+        # and display names, so the run loop skips per-step attribute dispatch
+        self._plan = [(step.execute, step.__class__.__name__) for step in self.steps]
 
-    def start(self, blocking: bool = True) -> bool:
+    @classmethod
+    def _get_lock(cls, scope: str) -> threading.Lock:
+        """Get (creating on demand) the execution lock for a scope."""
+        with cls._locks_guard:
+            lock = cls._locks.get(scope)
+            if lock is None:
+                lock = cls._locks[scope] = threading.Lock()
+            return lock
+
+    def start(self, blocking: bool = True, scope: str = "global") -> bool:
         """
         Start executing the routine.
 
         Args:
             blocking: If True, blocks until routine completes.
                      If False, runs in background thread.
+            scope: Mutual-exclusion scope (e.g. a device or user id).
+                   Routines with different scopes may run concurrently.
 
         Returns:
             bool: True if routine started successfully
         """
-        # Check if another routine is running
-        if not Routine._execution_lock.acquire(blocking=False):
-            print(
-                f"Cannot start routine '{self.name}': another routine is currently running"
+        # Check if another routine is running on this scope
+        lock = Routine._get_lock(scope)
+        if not lock.acquire(blocking=False):
+            log.warning(
+                "Cannot start routine '%s': another routine is currently running",
+                self.name,
             )
             return False
 
+        self._scope = scope
         try:
-            Routine._currently_running = self.name
+            Routine._currently_running[scope] = self.name
 
             if blocking:
                 self._execute()
@@ -97,52 +156,70 @@ class Routine:
             return True
 
         except Exception as e:
-            print(f"Error starting routine: {e}")
-            Routine._execution_lock.release()
-            Routine._currently_running = None
+            log.error("Error starting routine: %s", e)
+            lock.release()
+            Routine._currently_running.pop(scope, None)
             return False
 
     def _execute(self):
         """Execute all steps in sequence."""
-        print(f"Starting routine: {self.name}")
+        log.info("Starting routine: %s", self.name)
         start_time = datetime.now()
 
         try:
-            for i, step in enumerate(self.steps):
-                if self._stop_event.is_set():
-                    print(
-                        f"Routine '{self.name}' stopped at step {i+1}/{len(self.steps)}"
-                    )
-                    break
+            # Instances may be reused across runs (see _build_from_frozen),
+            # so per-run mutable state is reset here rather than in __init__
+            self._stop_event.clear()
+            for step in self.steps:
+                step._stop_event.clear()
+                step._process = None
 
-                print(
-                    f"Executing step {i+1}/{len(self.steps)}: {step.__class__.__name__}"
-                )
+            # Kick off the steps' network prefetches without waiting, so
+            # their latencies overlap with the steps that run first; each
+            # step settles only its own prefetch right before executing,
+            # so step 1 (usually the alarm) rings immediately instead of
+            # waiting on every fetch
+            prefetches = [_PREFETCH_POOL.submit(step.prefetch) for step in self.steps]
+
+            n_steps = len(self._plan)
+            stop_wait = self._stop_event.wait
+
+            for i, (run, step_name) in enumerate(self._plan, 1):
+                log.info("Executing step %d/%d: %s", i, n_steps, step_name)
+
+                # Settle this step's own prefetch (implementations catch
+                # their errors; execute() falls back to a direct fetch)
+                prefetches[i - 1].result()
 
                 # Execute the step
-                success = step.execute()
+                success = run()
 
                 if not success:
-                    print(f"Step {i+1} failed, but continuing...")
+                    log.warning("Step %d failed, but continuing...", i)
 
-                # Small delay between steps
-                time.sleep(0.5)
+                # Small delay between steps; wakes immediately if stop() is
+                # called during the wait
+                if stop_wait(0.5):
+                    log.info(
+                        "Routine '%s' stopped at step %d/%d", self.name, i, n_steps
+                    )
+                    break
 
             duration = (datetime.now() - start_time).total_seconds()
-            print(f"Routine '{self.name}' completed in {duration:.1f} seconds")
+            log.info("Routine '%s' completed in %.1f seconds", self.name, duration)
 
         except Exception as e:
-            print(f"Error executing routine '{self.name}': {e}")
+            log.error("Error executing routine '%s': %s", self.name, e)
 
         finally:
-            # Release the lock
-            Routine._execution_lock.release()
-            Routine._currently_running = None
+            # Release this scope's lock
+            Routine._get_lock(self._scope).release()
+            Routine._currently_running.pop(self._scope, None)
             self._stop_event.clear()
 
     def stop(self):
         """Stop the routine execution."""
-        print(f"Stopping routine: {self.name}")
+        log.info("Stopping routine: %s", self.name)
         self._stop_event.set()
 
         # Stop all steps
@@ -157,32 +234,28 @@ class Routine:
         """
         Validate the routine configuration.
 
+        Validation already happened step by step in _build_steps, so this
+        is just a read of the collected errors.
+
         Returns:
             tuple: (is_valid, list_of_error_messages)
         """
-        errors = []
-
-        if not self.name:
-            errors.append("Routine name is required")
-
-        if not self.steps_config:
-            errors.append("Routine must have at least one step")
-
-        # Validate each step
-        for i, step in enumerate(self.steps):
-            is_valid, error = step.validate_config()
-            if not is_valid:
-                errors.append(f"Step {i+1} ({step.__class__.__name__}): {error}")
-
-        return len(errors) == 0, errors
+        return not self._build_errors, self._build_errors
 
     def to_dict(self) -> Dict[str, Any]:
         """Serialize routine to dictionary."""
         return {"id": self.routine_id, "name": self.name, "steps": self.steps_config}
 
     def to_json(self) -> str:
-        """Serialize routine to JSON string."""
-        return json.dumps(self.to_dict(), indent=2)
+        """
+        Serialize routine to JSON string.
+
+        The config is immutable after construction, so the encoded string
+        is computed once per instance and reused (also serves __hash__).
+        """
+        if self._json_cache is None:
+            self._json_cache = _dumps(self.to_dict())
+        return self._json_cache
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Routine":
@@ -191,16 +264,36 @@ class Routine:
             name=data["name"], steps_config=data["steps"], routine_id=data.get("id")
         )
 
+    @classmethod
+    @functools.lru_cache(maxsize=32)
+    def _build_from_frozen(cls, frozen_json: str) -> "Routine":
+        """
+        Build (or return the cached) Routine for a JSON snapshot.
+
+        Recurring schedules fire with identical JSON day after day;
+        caching on the frozen string reuses the already-built RoutineStep
+        instances instead of reconstructing them every run. Per-run
+        mutable state is reset at the top of _execute, so reuse is safe.
+        """
+        return cls.from_dict(_loads(frozen_json))
+
     @classmethod
     def from_json(cls, json_str: str) -> "Routine":
         """Create a Routine from a JSON string."""
-        data = json.loads(json_str)
-        return cls.from_dict(data)
+        return cls._build_from_frozen(json_str)
 
     @classmethod
-    def get_currently_running(cls) -> Optional[str]:
-        """Get the name of the currently running routine, if any."""
-        return cls._currently_running
+    def get_currently_running(cls, scope: str = "global") -> Optional[str]:
+        """Get the name of the routine running on a scope, if any."""
+        return cls._currently_running.get(scope)
+
+    def __eq__(self, other):
+        if not isinstance(other, Routine):
+            return NotImplemented
+        return self.to_dict() == other.to_dict()
+
+    def __hash__(self):
+        return hash(self.to_json())
 
     def __repr__(self):
         return f"<Routine '{self.name}' with {len(self.steps)} steps>"
@@ -6,14 +6,67 @@ performed as part of a morning routine (alarm, news, weather, etc.)
 """
 
 from abc import ABC, abstractmethod
+import atexit
+import bisect
+import logging
 import subprocess
 import time
 import os
 import re
 import json
+import shlex
+import webbrowser
 from typing import Optional, Dict, Any
 import threading
 
+log = logging.getLogger(__name__)
+
+# Third-party dependencies imported once at module load instead of on every
+# step execution; steps that need a missing one fail gracefully
+try:
+    import feedparser
+except ImportError:
+    feedparser = None
+
+try:
+    import requests
+except ImportError:
+    requests = None
+    _HTTP = None
+else:
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
+
+    # Shared session: keep-alive reuses the TCP+TLS connection across calls
+    # instead of a fresh handshake per request. Weather.gov also requires a
+    # User-Agent and may 403 the requests default.
+    _HTTP = requests.Session()
+    _HTTP.headers.update({"User-Agent": "smart-alarm/1.0"})
+    _HTTP.mount(
+        "https://",
+        HTTPAdapter(
+            max_retries=Retry(
+                total=3, backoff_factor=0.5, status_forcelist=[500, 502, 503, 504]
+            )
+        ),
+    )
+
+try:
+    from google_images_downloader import GoogleImagesDownloader
+except ImportError:
+    GoogleImagesDownloader = None
+
+# /dev/null opened once; Popen dup2's it into each child, so the parent fd
+# stays valid across TTS invocations instead of reopening per call
+_DEVNULL_FD = os.open(os.devnull, os.O_WRONLY)
+
+# Compiled once: strips HTML tags and the Guardian's trailing
+# "Continue reading..." in a single pass
+_HTML_OR_TAIL_RE = re.compile(r"<[^>]*>|Continue reading\.\.\.")
+
+# Deletes mojibake smart-quote characters without a regex pass
+_SMART_QUOTES = str.maketrans("", "", 'â€œ"')
+
 
 class RoutineStep(ABC):
     """
@@ -34,6 +87,11 @@ class RoutineStep(ABC):
         self.config = config or {}
         self._stop_event = threading.Event()
         self._process = None
+        # Config values are read once here and bound to attributes, so the
+        # execute() hot paths do attribute loads instead of dict lookups
+        self._tts_command = self.config.get(
+            "tts_command", 'simple_google_tts en "{text}"'
+        )
 
     @abstractmethod
     def execute(self) -> bool:
@@ -45,6 +103,17 @@ class RoutineStep(ABC):
         """
         pass
 
+    def prefetch(self):
+        """
+        Perform any network I/O that can run ahead of execution.
+
+        Called concurrently for all steps before the sequential execute()
+        loop, so independent fetches overlap instead of adding up.
+        Implementations must catch their own errors; execute() falls back
+        to fetching directly when no prefetched data is available.
+        """
+        pass
+
     def stop(self):
         """Stop execution of this step if it's running."""
         self._stop_event.set()
@@ -64,6 +133,32 @@ class RoutineStep(ABC):
         """
         return f"<div class='routine-step'>{self.__class__.__name__}</div>"
 
+    def _speak_text(self, text: str):
+        """Use TTS to speak the provided text."""
+        tts_command = self._tts_command
+
+        # Build an argv list so the TTS binary is exec'd directly, skipping
+        # the /bin/sh fork and any shell interpretation of the spoken text
+        if isinstance(tts_command, list):
+            argv = [arg.replace("{text}", text) for arg in tts_command]
+        else:
+            # Templates conventionally quote the placeholder ('... "{text}"');
+            # strip that before quoting so the text lands in a single argument
+            command = tts_command.replace('"{text}"', "{text}").replace(
+                "{text}", shlex.quote(text)
+            )
+            argv = shlex.split(command)
+
+        try:
+            self._process = subprocess.Popen(
+                argv,
+                stdout=_DEVNULL_FD,
+                stderr=_DEVNULL_FD,
+            )
+            self._process.wait()
+        except Exception as e:
+            log.error("Error with TTS: %s", e)
+
     def validate_config(self) -> tuple[bool, Optional[str]]:
         """
         Validate the configuration for this step.
@@ -92,12 +187,20 @@ class Alarm(RoutineStep):
         duration (int, optional): Auto-stop after this many seconds
     """
 
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        super().__init__(config)
+        self._audio_file = self.config.get("audio_file")
+        self._duration = self.config.get("duration")
+        # Stat result cached by validate_config so execute() can skip a
+        # second filesystem round trip
+        self._audio_st = None
+
     def execute(self) -> bool:
-        audio_file = self.config.get("audio_file")
-        duration = self.config.get("duration")
+        audio_file = self._audio_file
+        duration = self._duration
 
-        if not audio_file or not os.path.exists(audio_file):
-            print(f"Audio file not found: {audio_file}")
+        if not audio_file or (self._audio_st is None and not os.path.exists(audio_file)):
+            log.error("Audio file not found: %s", audio_file)
             return False
 
         try:
@@ -108,13 +211,10 @@ class Alarm(RoutineStep):
                 stderr=subprocess.DEVNULL,
             )
 
-            # Wait for duration or until stopped
+            # Wait for duration or until stopped; a single blocking wait that
+            # wakes immediately on stop() instead of polling every 100 ms
             if duration:
-                start_time = time.time()
-                while time.time() - start_time < duration:
-                    if self._stop_event.is_set():
-                        break
-                    time.sleep(0.1)
+                self._stop_event.wait(timeout=duration)
                 self.stop()
             else:
                 # Wait for process to complete
@@ -123,14 +223,17 @@ class Alarm(RoutineStep):
             return True
 
         except Exception as e:
-            print(f"Error playing alarm: {e}")
+            log.error("Error playing alarm: %s", e)
             return False
 
     def validate_config(self) -> tuple[bool, Optional[str]]:
-        audio_file = self.config.get("audio_file")
+        audio_file = self._audio_file
         if not audio_file:
             return False, "audio_file is required"
-        if not os.path.exists(audio_file):
+        try:
+            # One stat() call both checks existence and caches the result
+            self._audio_st = os.stat(audio_file)
+        except OSError:
             return False, f"Audio file not found: {audio_file}"
         return True, None
 
@@ -147,58 +250,131 @@ class News(RoutineStep):
         tts_command (str): TTS command template (default: 'simple_google_tts en "{text}"')
     """
 
+    # Shared downloader: Chromium launches once per process instead of on
+    # every news step (closed at interpreter exit). The lock is reentrant
+    # and held for whole downloads: the single browser session can't be
+    # driven by two routines at once
+    _downloader = None
+    _downloader_lock = threading.RLock()
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__(config)
         self.images = []
         self.news_text = ""
         self.news_title = ""
+        self._feed = None
+        self._rss_url = self.config.get("rss_url")
+        self._num_images = self.config.get("num_images", 6)
+        self._overlap_download = self.config.get("overlap_download", True)
+
+    @classmethod
+    def _get_downloader(cls):
+        with cls._downloader_lock:
+            if cls._downloader is None:
+                cls._downloader = GoogleImagesDownloader(
+                    browser="chrome", show=False, debug=False, quiet=True
+                )
+                atexit.register(cls._close_downloader)
+            return cls._downloader
+
+    @classmethod
+    def _close_downloader(cls):
+        with cls._downloader_lock:
+            if cls._downloader is not None:
+                try:
+                    cls._downloader.close()
+                except Exception:
+                    pass
+                cls._downloader = None
+
+    @staticmethod
+    def _parse_feed(url):
+        """Parse the RSS feed, bounding the fetch with the shared session.
+
+        feedparser.parse(url) has no network timeout, so when requests is
+        available the document is fetched through _HTTP with the usual 5s
+        timeout and the bytes handed to feedparser.
+        """
+        if _HTTP is not None:
+            response = _HTTP.get(url, timeout=5)
+            response.raise_for_status()
+            return feedparser.parse(response.content)
+        return feedparser.parse(url)
+
+    def prefetch(self):
+        """Fetch and parse the RSS feed ahead of execution."""
+        if feedparser is None:
+            return
+        if not self._rss_url:
+            return
+        try:
+            self._feed = self._parse_feed(self._rss_url)
+        except Exception as e:
+            log.warning("Error prefetching news: %s", e)
 
     def execute(self) -> bool:
         try:
-            import feedparser
+            if feedparser is None:
+                log.error("feedparser is not installed")
+                return False
 
-            rss_url = self.config.get("rss_url")
-            if not rss_url:
+            if not self._rss_url:
                 return False
 
-            # Parse RSS feed
-            feed = feedparser.parse(rss_url)
+            # Use the prefetched feed if available, else fetch now
+            feed = self._feed or self._parse_feed(self._rss_url)
+            self._feed = None
 
             if not feed.entries:
-                print("No news articles found")
+                log.warning("No news articles found")
                 return False
 
             article = feed.entries[0]
             self.news_title = article.get("title", "")
 
-            # Extract summary and clean HTML tags
+            # Extract summary, clean HTML tags and smart quotes in one pass
             summary = article.get("summary", "")
-            summary = re.sub(r"<.*?>", "", summary)
-            summary = re.sub(r'[â€œâ€"]', "", summary)
-            summary = re.sub(r"Continue reading...", "", summary)
+            summary = _HTML_OR_TAIL_RE.sub("", summary).translate(_SMART_QUOTES)
 
             self.news_text = f"Now, today's news: {self.news_title}. {summary}"
 
-            # Download images based on title keywords
-            self._download_images()
+            if self._overlap_download:
+                # Image download and speech are independent, so run the
+                # download in the background while the narration plays;
+                # total time drops from sum to max of the two
+                download_thread = threading.Thread(
+                    target=self._download_images, name="News-image-download"
+                )
+                download_thread.start()
 
-            # Speak the news using TTS
-            self._speak_text(self.news_text)
+                # Speak the news using TTS
+                self._speak_text(self.news_text)
+
+                download_thread.join()
+            else:
+                # Download images based on title keywords
+                self._download_images()
+
+                # Speak the news using TTS
+                self._speak_text(self.news_text)
 
             return True
 
         except Exception as e:
-            print(f"Error fetching news: {e}")
+            log.error("Error fetching news: %s", e)
             return False
 
     def _download_images(self):
         """Download images related to the news article."""
         try:
-            from google_images_downloader import GoogleImagesDownloader
+            if GoogleImagesDownloader is None:
+                log.error("google_images_downloader is not installed")
+                self.images = []
+                return
 
             # Extract keywords from title (simple approach: use title)
             keywords = self.news_title
-            num_images = self.config.get("num_images", 6)
+            num_images = self._num_images
 
             # Define download destination
             images_dir = os.path.join(
@@ -206,59 +382,51 @@ class News(RoutineStep):
             )
             os.makedirs(images_dir, exist_ok=True)
 
-            downloader = GoogleImagesDownloader(
-                browser="chrome", show=False, debug=False, quiet=True
-            )
-
-            downloader.download(
-                keywords,
-                destination=images_dir,
-                limit=num_images,
-                resize=(1920, 1080),
-                file_format="JPEG",
-            )
-
-            downloader.close()
-
-            # Store list of downloaded images
-            self.images = [
-                f
-                for f in os.listdir(images_dir)
-                if f.endswith((".jpg", ".jpeg", ".png"))
-            ]
+            download_started = time.time()
+            # Serialize on the shared browser session; if the download
+            # blows up (e.g. Chromium crashed), discard the session so
+            # the next news step relaunches instead of reusing a dead one
+            with self._downloader_lock:
+                downloader = self._get_downloader()
+                try:
+                    downloader.download(
+                        keywords,
+                        destination=images_dir,
+                        limit=num_images,
+                        resize=(1920, 1080),
+                        file_format="JPEG",
+                    )
+                except Exception:
+                    self._close_downloader()
+                    raise
+
+            # Store only this run's downloads; the directory accumulates
+            # images across days, so filter by modification time
+            with os.scandir(images_dir) as entries:
+                self.images = [
+                    entry.name
+                    for entry in entries
+                    if entry.is_file()
+                    and entry.stat().st_mtime >= download_started
+                    and entry.name.lower().endswith((".jpg", ".jpeg", ".png"))
+                ]
 
         except Exception as e:
-            print(f"Error downloading images: {e}")
+            log.error("Error downloading images: %s", e)
             self.images = []
 
-    def _speak_text(self, text: str):
-        """Use TTS to speak the provided text."""
-        tts_command = self.config.get("tts_command", 'simple_google_tts en "{text}"')
-
-        # Format the command with the text
-        command = tts_command.replace("{text}", text)
-
-        try:
-            self._process = subprocess.Popen(
-                command,
-                shell=True,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
-            self._process.wait()
-        except Exception as e:
-            print(f"Error with TTS: {e}")
-
     def format_html(self) -> str:
         """Generate HTML for displaying news with slideshow."""
         if not self.images:
             return f"<div class='news-item'><h3>{self.news_title}</h3><p>{self.news_text}</p></div>"
 
+        # Generator expression (no intermediate list), and lazy loading so
+        # the browser doesn't fetch and decode every image up front
+        prefix = "/static/alarm_app/images/news/"
         image_html = "\n".join(
-            [
-                f'<img src="/static/alarm_app/images/news/{img}" alt="News image" class="slideshow-image" />'
-                for img in self.images
-            ]
+            f'<img src="{prefix}{img}" alt="News image" class="slideshow-image" '
+            f'loading="lazy" decoding="async" />'
+            for img in self.images
         )
 
         return f"""
@@ -275,8 +443,7 @@ class News(RoutineStep):
         """
 
     def validate_config(self) -> tuple[bool, Optional[str]]:
-        rss_url = self.config.get("rss_url")
-        if not rss_url:
+        if not self._rss_url:
             return False, "rss_url is required"
         return True, None
 
@@ -301,37 +468,62 @@ class WeatherUtil(RoutineStep):
         "; I also recommend a rain jacket or an umbrella",
     ]
 
+    # Upper temperature bounds for OUTFIT_SUGGESTIONS[0..3]
+    TEMP_THRESHOLDS = (53, 60, 69)
+
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__(config)
         self.weather_text = ""
+        self._current_period = None
+        self._latitude = self.config.get("latitude")
+        self._longitude = self.config.get("longitude")
+
+    def _fetch_forecast(self, latitude, longitude):
+        """Fetch the current forecast period from the Weather.gov API."""
+        response = _HTTP.get(
+            f"https://api.weather.gov/points/{latitude},{longitude}", timeout=5
+        )
 
-    def execute(self) -> bool:
-        try:
-            import requests
+        if not response.ok:
+            return None
 
-            latitude = self.config.get("latitude")
-            longitude = self.config.get("longitude")
+        data = response.json()
+        forecast_url = data["properties"]["forecast"]
 
-            if not latitude or not longitude:
-                return False
+        forecast_response = _HTTP.get(forecast_url, timeout=5)
+        forecast_data = forecast_response.json()
 
-            # Get weather from Weather.gov API
-            response = requests.get(
-                f"https://api.weather.gov/points/{latitude},{longitude}"
-            )
+        return forecast_data["properties"]["periods"][0]
 
-            if not response.ok:
-                print("Failed to fetch weather data")
+    def prefetch(self):
+        """Fetch the forecast ahead of execution."""
+        if requests is None:
+            return
+        if not self._latitude or not self._longitude:
+            return
+        try:
+            self._current_period = self._fetch_forecast(self._latitude, self._longitude)
+        except Exception as e:
+            log.warning("Error prefetching weather: %s", e)
+
+    def execute(self) -> bool:
+        try:
+            if requests is None:
+                log.error("requests is not installed")
                 return False
 
-            data = response.json()
-            forecast_url = data["properties"]["forecast"]
+            if not self._latitude or not self._longitude:
+                return False
 
-            forecast_response = requests.get(forecast_url)
-            forecast_data = forecast_response.json()
+            # Use the prefetched forecast if available, else fetch now
+            current_period = self._current_period or self._fetch_forecast(
+                self._latitude, self._longitude
+            )
+            self._current_period = None
 
-            # Extract current period forecast
-            current_period = forecast_data["properties"]["periods"][0]
+            if not current_period:
+                log.error("Failed to fetch weather data")
+                return False
 
             temp = int(current_period["temperature"])
             wind_speed = current_period["windSpeed"]
@@ -355,57 +547,31 @@ class WeatherUtil(RoutineStep):
             return True
 
         except Exception as e:
-            print(f"Error fetching weather: {e}")
+            log.error("Error fetching weather: %s", e)
             return False
 
     def _parse_wind_speed(self, wind_speed_str: str) -> int:
         """Parse wind speed string to get maximum speed."""
-        if " to " in wind_speed_str:
-            parts = wind_speed_str.split(" to ")
-            speed = re.sub(r" mph", "", parts[1])
-            return int(speed)
-        else:
-            speed = re.sub(r" mph", "", wind_speed_str)
-            return int(speed)
+        # "5 to 10 mph" or "10 mph"; plain string ops, no regex engine
+        speed = wind_speed_str.split(" to ")[-1].removesuffix(" mph").strip()
+        return int(speed)
 
     def _get_outfit_recommendation(
         self, temp: int, wind_speed: int, forecast: str
     ) -> str:
         """Generate clothing recommendation based on weather conditions."""
-        if temp < 53:
-            recommendation = self.OUTFIT_SUGGESTIONS[0]
-        elif temp < 60:
-            recommendation = self.OUTFIT_SUGGESTIONS[1]
-        elif temp < 69:
-            recommendation = self.OUTFIT_SUGGESTIONS[2]
-        else:
-            recommendation = self.OUTFIT_SUGGESTIONS[3]
+        recommendation = self.OUTFIT_SUGGESTIONS[
+            bisect.bisect(self.TEMP_THRESHOLDS, temp)
+        ]
 
         if wind_speed > 14:
             recommendation += self.OUTFIT_SUGGESTIONS[4]
 
-        if "rain" in forecast.lower():
+        if "rain" in forecast.casefold():
             recommendation += self.OUTFIT_SUGGESTIONS[5]
 
         return recommendation
 
-    def _speak_text(self, text: str):
-        """Use TTS to speak the weather forecast."""
-        tts_command = self.config.get("tts_command", 'simple_google_tts en "{text}"')
-
-        command = tts_command.replace("{text}", text)
-
-        try:
-            self._process = subprocess.Popen(
-                command,
-                shell=True,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
-            self._process.wait()
-        except Exception as e:
-            print(f"Error with TTS: {e}")
-
     def format_html(self) -> str:
         """Generate HTML for displaying weather."""
         return f"""
@@ -416,10 +582,7 @@ class WeatherUtil(RoutineStep):
         """
 
     def validate_config(self) -> tuple[bool, Optional[str]]:
-        latitude = self.config.get("latitude")
-        longitude = self.config.get("longitude")
-
-        if not latitude or not longitude:
+        if not self._latitude or not self._longitude:
             return False, "latitude and longitude are required"
 
         return True, None
@@ -435,9 +598,14 @@ class URLOpener(RoutineStep):
         tts_command (str): TTS command template
     """
 
+    def __init__(self, config: Optional[Dict[str, Any]] = None):
+        super().__init__(config)
+        self._url = self.config.get("url")
+        self._message = self.config.get("message")
+
     def execute(self) -> bool:
-        url = self.config.get("url")
-        message = self.config.get("message")
+        url = self._url
+        message = self._message
 
         if not url:
             return False
@@ -448,30 +616,16 @@ class URLOpener(RoutineStep):
                 self._speak_text(message)
 
             # Open URL in browser
-            import webbrowser
-
             webbrowser.open_new_tab(url)
 
             return True
 
         except Exception as e:
-            print(f"Error opening URL: {e}")
+            log.error("Error opening URL: %s", e)
             return False
 
-    def _speak_text(self, text: str):
-        """Use TTS to speak the message."""
-        tts_command = self.config.get("tts_command", 'simple_google_tts en "{text}"')
-
-        command = tts_command.replace("{text}", text)
-
-        try:
-            subprocess.run(command, shell=True, check=True)
-        except Exception as e:
-            print(f"Error with TTS: {e}")
-
     def validate_config(self) -> tuple[bool, Optional[str]]:
-        url = self.config.get("url")
-        if not url:
+        if not self._url:
             return False, "url is required"
         return True, None
 
@@ -487,12 +641,13 @@ class QuoteFetcher(RoutineStep):
 
     def __init__(self, config: Optional[Dict[str, Any]] = None):
         super().__init__(config)
+        self._intro_text = self.config.get("intro_text", "Your quote of the day is")
 
     def execute(self) -> bool:
         try:
             from .models import Quote
             self.quote = Quote.get_random_quote()
-            intro = self.config.get("intro_text", "Your quote of the day is")
+            intro = self._intro_text
             if self.quote.author:
                 message = f"{intro}: {self.quote.text} - {self.quote.author}"
             else:
@@ -504,26 +659,9 @@ class QuoteFetcher(RoutineStep):
             return True
 
         except Exception as e:
-            print(f"Error fetching quote: {e}")
+            log.error("Error fetching quote: %s", e)
             return False
 
-    def _speak_text(self, text: str):
-        """Use TTS to speak the quote."""
-        tts_command = self.config.get("tts_command", 'simple_google_tts en "{text}"')
-
-        command = tts_command.replace("{text}", text)
-
-        try:
-            self._process = subprocess.Popen(
-                command,
-                shell=True,
-                stdout=subprocess.DEVNULL,
-                stderr=subprocess.DEVNULL,
-            )
-            self._process.wait()
-        except Exception as e:
-            print(f"Error with TTS: {e}")
-
     def format_html(self) -> str:
         """Generate HTML for displaying the quote."""
         return f"""
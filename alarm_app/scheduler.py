@@ -26,7 +26,7 @@ Install: pip install django-q
 # 3. Add Django-Q configuration to config/settings.py:
 #    Q_CLUSTER = {
 #        'name': 'smart_alarm',
-#        'workers': 2,
+#        'workers': multiprocessing.cpu_count(),
 #        'timeout': 600,
 #        'retry': 3600,
 #        'queue_limit': 50,
@@ -42,13 +42,25 @@ Install: pip install django-q
 #
 # 6. Schedule routines using this module
 
-from django_q.tasks import schedule, Schedule
-from django_q.models import Schedule as ScheduleModel
+from datetime import datetime, timedelta
+
+from django.db import transaction
 from django.utils import timezone
+from django.utils.timezone import localtime
+import functools
 import logging
+import os
 
 logger = logging.getLogger(__name__)
 
+# Cron day-of-week strings for all 128 day masks, built once at import.
+# Bit 0 is Monday (cron day 1) through bit 6 Sunday (cron day 0), so a
+# mask indexes straight to its joined string with no per-routine branching.
+_CRON_DAYS_BY_MASK = tuple(
+    ",".join(str((bit + 1) % 7) for bit in range(7) if mask >> bit & 1)
+    for mask in range(128)
+)
+
 
 def execute_routine(routine_id):
     """
@@ -62,7 +74,21 @@ def execute_routine(routine_id):
     
     try:
         routine_model = Routine.objects.get(id=routine_id, enabled=True)
-        
+
+        # Single-flight guard: if an earlier run of this routine is still
+        # in progress (a cron tick can overlap a long run), skip instead
+        # of queueing a duplicate. The partial index on status='started'
+        # keeps this an O(1) probe.
+        if RoutineLog.objects.filter(
+            routine=routine_model,
+            status="started",
+            started_at__gte=timezone.now() - timedelta(hours=1),
+        ).exists():
+            logger.info(
+                f"Routine '{routine_model.name}' is already running, skipping"
+            )
+            return False
+
         # Create log entry
         log = RoutineLog.objects.create(
             routine=routine_model,
@@ -89,19 +115,21 @@ def execute_routine(routine_id):
                 log.status = "failed"
                 log.error_message = error_msg
                 log.completed_at = timezone.now()
-                log.save()
+                log.save(update_fields=["status", "error_message", "completed_at"])
                 return False
-            
+
             # Execute
             success = executor.start(blocking=True)
-            
-            # Update log
-            log.completed_at = timezone.now()
-            log.status = "completed" if success else "failed"
-            log.save()
-            
-            # Mark routine as run
-            routine_model.mark_as_run()
+
+            # One commit for the log update and the run counters instead
+            # of two; both are single-column-set UPDATEs
+            with transaction.atomic():
+                log.completed_at = timezone.now()
+                log.status = "completed" if success else "failed"
+                log.save(update_fields=["status", "completed_at"])
+
+                # Mark routine as run
+                routine_model.mark_as_run()
             
             logger.info(f"Routine '{routine_model.name}' completed successfully")
             return True
@@ -111,7 +139,7 @@ def execute_routine(routine_id):
             log.status = "failed"
             log.error_message = str(e)
             log.completed_at = timezone.now()
-            log.save()
+            log.save(update_fields=["status", "error_message", "completed_at"])
             return False
             
     except Exception as e:
@@ -119,77 +147,132 @@ def execute_routine(routine_id):
         return False
 
 
-def schedule_routine(routine):
+@functools.lru_cache(maxsize=256)
+def _cron_next_run(cron, now_minute):
     """
-    Schedule a routine using Django-Q.
-    
-    Args:
-        routine: Routine model instance
+    First run time for a cron string, matching Schedule.calculate_next_run.
+
+    Routines cluster on a handful of wake times, so reloads repeat the
+    same cron strings; keying the memo on the current minute keeps
+    results exact (schedules are minute-granular) while letting every
+    routine sharing a schedule reuse one croniter evaluation. The value
+    is computed from now_minute itself so key and result always agree,
+    even if the wall-clock minute ticks over mid-reload.
     """
-    schedule_name = f"routine_{routine.id}"
-    
-    # Remove existing schedule if it exists
-    ScheduleModel.objects.filter(name=schedule_name).delete()
-    
-    if not routine.enabled:
-        logger.info(f"Routine '{routine.name}' is disabled, not scheduling")
-        return
-    
-    if routine.schedule_type == "once":
+    from croniter import croniter
+
+    return croniter(cron, now_minute).get_next(datetime)
+
+
+# Fields _build_schedule_model needs; reload fetches exactly these as
+# plain dicts, skipping model instantiation and descriptor access
+_SCHEDULE_FIELDS = (
+    "id",
+    "name",
+    "enabled",
+    "schedule_type",
+    "scheduled_datetime",
+    "time_of_day",
+    "days_mask",
+)
+
+
+def _build_schedule_model(routine):
+    """
+    Build an unsaved ScheduleModel for a routine.
+
+    Pure function of the routine's scheduling fields, passed as a dict
+    (see _SCHEDULE_FIELDS): computes the cron string / next_run exactly
+    as before, but leaves persistence to the caller so
+    reload_all_schedules can bulk-insert.
+
+    Returns:
+        ScheduleModel or None if the routine cannot be scheduled
+    """
+    from django_q.models import Schedule as ScheduleModel
+
+    name = routine["name"]
+    schedule_name = f"routine_{routine['id']}"
+
+    if not routine["enabled"]:
+        logger.info(f"Routine '{name}' is disabled, not scheduling")
+        return None
+
+    if routine["schedule_type"] == "once":
         # One-time execution
-        if not routine.scheduled_datetime:
-            logger.warning(f"Routine '{routine.name}' has no scheduled_datetime")
-            return
-        
-        schedule(
-            'alarm_app.scheduler.execute_routine',
-            routine.id,
+        scheduled_datetime = routine["scheduled_datetime"]
+        if not scheduled_datetime:
+            logger.warning(f"Routine '{name}' has no scheduled_datetime")
+            return None
+
+        logger.info(f"Scheduled one-time routine '{name}' for {scheduled_datetime}")
+        return ScheduleModel(
+            func='alarm_app.scheduler.execute_routine',
+            args=f"({routine['id']},)",
             name=schedule_name,
             schedule_type='O',  # Once
-            next_run=routine.scheduled_datetime,
+            next_run=scheduled_datetime,
         )
-        
-        logger.info(f"Scheduled one-time routine '{routine.name}' for {routine.scheduled_datetime}")
-        
-    elif routine.schedule_type == "recurring":
+
+    elif routine["schedule_type"] == "recurring":
         # Recurring execution
-        if not routine.time_of_day:
-            logger.warning(f"Routine '{routine.name}' has no time_of_day")
-            return
-        
-        # Build cron expression
-        days = []
-        if routine.monday:
-            days.append('1')
-        if routine.tuesday:
-            days.append('2')
-        if routine.wednesday:
-            days.append('3')
-        if routine.thursday:
-            days.append('4')
-        if routine.friday:
-            days.append('5')
-        if routine.saturday:
-            days.append('6')
-        if routine.sunday:
-            days.append('0')
-        
+        time_of_day = routine["time_of_day"]
+        if not time_of_day:
+            logger.warning(f"Routine '{name}' has no time_of_day")
+            return None
+
+        # Day-of-week part is a straight table lookup on the bitmask
+        days = _CRON_DAYS_BY_MASK[routine["days_mask"] & 0x7F]
         if not days:
-            logger.warning(f"Routine '{routine.name}' has no days selected")
-            return
-        
+            logger.warning(f"Routine '{name}' has no days selected")
+            return None
+
         # Cron format: minute hour day month day_of_week
-        cron = f"{routine.time_of_day.minute} {routine.time_of_day.hour} * * {','.join(days)}"
-        
-        schedule(
-            'alarm_app.scheduler.execute_routine',
-            routine.id,
+        cron = f"{time_of_day.minute} {time_of_day.hour} * * {days}"
+
+        logger.info(f"Scheduled recurring routine '{name}' with cron: {cron}")
+        schedule_model = ScheduleModel(
+            func='alarm_app.scheduler.execute_routine',
+            args=f"({routine['id']},)",
             name=schedule_name,
             schedule_type='C',  # Cron
             cron=cron,
         )
-        
-        logger.info(f"Scheduled recurring routine '{routine.name}' with cron: {cron}")
+        # Schedule.save() normally derives next_run from the cron string;
+        # bulk_create skips save(), so compute it here (memoized across
+        # routines that share a wake time)
+        schedule_model.next_run = _cron_next_run(
+            cron, localtime().replace(second=0, microsecond=0)
+        )
+        return schedule_model
+
+    return None
+
+
+def schedule_routine(routine):
+    """
+    Schedule a routine using Django-Q.
+
+    Args:
+        routine: Routine model instance
+    """
+    from django_q.models import Schedule as ScheduleModel
+
+    schedule_model = _build_schedule_model(
+        {field: getattr(routine, field) for field in _SCHEDULE_FIELDS}
+    )
+    if schedule_model is None:
+        # Not schedulable (disabled, missing time/days): drop any stale row
+        ScheduleModel.objects.filter(name=f"routine_{routine.id}").delete()
+        return
+
+    # DELETE+INSERT in one transaction: no window where the schedule is
+    # missing, and unlike update_or_create on the unconstrained name
+    # column it converges to a single row under concurrent calls and
+    # repairs duplicates instead of raising MultipleObjectsReturned
+    with transaction.atomic():
+        ScheduleModel.objects.filter(name=schedule_model.name).delete()
+        schedule_model.save()
 
 
 def reload_all_schedules():
@@ -197,28 +280,125 @@ def reload_all_schedules():
     Reload all routine schedules.
     Call this after creating/updating routines.
     """
+    from django_q.models import Schedule as ScheduleModel
+
     from .models import Routine
-    
+
     logger.info("Reloading all schedules with Django-Q")
-    
-    # Get all enabled routines
-    routines = Routine.objects.filter(enabled=True)
-    
-    # Remove all existing routine schedules
-    ScheduleModel.objects.filter(name__startswith='routine_').delete()
-    
-    # Schedule each routine
+
+    # Load only the scheduling columns (days_mask carries the weekday
+    # flags) as plain dicts, streamed in chunks: no model instantiation,
+    # no descriptor overhead, no wide text/JSON fields
+    routines = (
+        Routine.objects.filter(enabled=True)
+        .values(*_SCHEDULE_FIELDS)
+        .iterator(chunk_size=200)
+    )
+
+    # Build the desired state up front, keyed by schedule name
+    desired = {}
     for routine in routines:
         try:
-            schedule_routine(routine)
+            schedule_model = _build_schedule_model(routine)
         except Exception as e:
-            logger.error(f"Error scheduling routine '{routine.name}': {e}")
-    
-    logger.info(f"Scheduled {routines.count()} routine(s)")
+            logger.error(f"Error scheduling routine '{routine['name']}': {e}")
+            continue
+        if schedule_model is not None:
+            desired[schedule_model.name] = schedule_model
+
+    # Diff against what's already in django_q_schedule and only write the
+    # delta, instead of wiping and recreating every row (which churned the
+    # table and left a window with no next_run targets). Reloads overlap
+    # in normal operation (the web and qcluster processes both reload on
+    # startup, plus view-enqueued reload tasks), and name carries no
+    # unique constraint, so the read and the writes share one
+    # transaction with the routine_ rows locked for its duration; on
+    # SQLite the row lock is a no-op, so duplicate names are also swept
+    # on every pass, making the reload self-healing if a race slips
+    # a double insert in
+    batch_size = int(os.environ.get('ROUTINE_BULK_BATCH', '100'))
+    with transaction.atomic():
+        existing = {}
+        duplicate_pks = []
+        for schedule in ScheduleModel.objects.select_for_update().filter(
+            name__startswith='routine_'
+        ):
+            if schedule.name in existing:
+                duplicate_pks.append(schedule.pk)
+            else:
+                existing[schedule.name] = schedule
+
+        to_create = [model for name, model in desired.items() if name not in existing]
+        to_delete = existing.keys() - desired.keys()
+        to_update = []
+        for name in desired.keys() & existing.keys():
+            new, current = desired[name], existing[name]
+            # Cron rows recompute next_run on every build, so compare it
+            # only for one-time schedules
+            changed = (
+                current.func != new.func
+                or current.args != new.args
+                or current.schedule_type != new.schedule_type
+                or current.cron != new.cron
+                or (new.schedule_type == 'O' and current.next_run != new.next_run)
+            )
+            if changed:
+                current.func = new.func
+                current.args = new.args
+                current.schedule_type = new.schedule_type
+                current.next_run = new.next_run
+                current.cron = new.cron
+                to_update.append(current)
+
+        if duplicate_pks:
+            ScheduleModel.objects.filter(pk__in=duplicate_pks).delete()
+        if to_delete:
+            ScheduleModel.objects.filter(name__in=to_delete).delete()
+        if to_create:
+            ScheduleModel.objects.bulk_create(to_create, batch_size=batch_size)
+        if to_update:
+            ScheduleModel.objects.bulk_update(
+                to_update,
+                ['func', 'args', 'schedule_type', 'next_run', 'cron'],
+                batch_size=batch_size,
+            )
+
+    logger.info(
+        f"Scheduled {len(desired)} routine(s) "
+        f"({len(to_create)} new, {len(to_update)} updated, "
+        f"{len(to_delete) + len(duplicate_pks)} removed)"
+    )
+
+
+def request_schedule_reload():
+    """
+    Enqueue a coalesced rebuild of all routine schedules.
+
+    The view hooks call this instead of rewriting django_q_schedule
+    synchronously inside the HTTP request: the rebuild runs on a worker,
+    and repeated edits collapse into one queued task because a reload is
+    only enqueued while none is already waiting.
+    """
+    from django_q.models import OrmQ
+    from django_q.tasks import async_task
+
+    reload_func = 'alarm_app.scheduler.reload_all_schedules'
+
+    # The broker queue is small (Q_CLUSTER queue_limit), so scanning it
+    # for an already-queued reload is one cheap SELECT
+    for queued in OrmQ.objects.all():
+        if queued.func() == reload_func:
+            logger.info("Schedule reload already queued, skipping enqueue")
+            return
+
+    async_task(reload_func, group='reload_schedules')
+    logger.info("Enqueued schedule reload")
 
 
 def remove_routine_schedule(routine_id):
     """Remove a routine's schedule."""
+    from django_q.models import Schedule as ScheduleModel
+
     schedule_name = f"routine_{routine_id}"
     ScheduleModel.objects.filter(name=schedule_name).delete()
     logger.info(f"Removed schedule for routine {routine_id}")
@@ -5,12 +5,23 @@ Views for the Smart Alarm application.
 from django.shortcuts import render, redirect, get_object_or_404
 from django.contrib import messages
 from django.views.generic import ListView, DetailView, CreateView, UpdateView, DeleteView
+from django.core.cache import cache
+from django.db.models import Count, F, Q
 from django.urls import reverse_lazy
 from django.utils import timezone
 from datetime import datetime, time
-from .models import *
+from django_q.tasks import async_task
+from .models import (
+    UserProfile,
+    NewsSource,
+    WeatherLocation,
+    Quote,
+    Routine,
+    AudioFile,
+    RoutineLog,
+)
 from .forms import RoutineForm, UserProfileForm
-from .scheduler import schedule_routine, remove_routine_schedule, reload_all_schedules
+from .scheduler import remove_routine_schedule, request_schedule_reload
 
 def index(request):
     """
@@ -28,19 +39,34 @@ def index(request):
     # Get user profile
     user_profile = UserProfile.get_profile()
 
-    # Get statistics
-    all_routines = Routine.objects.all()
-    total_routines = all_routines.count()
-    active_routines = all_routines.filter(enabled=True)
-    active_routines_count = active_routines.count()
-
-    # Get routines scheduled for today
-    routines_today = [r for r in active_routines if r.is_scheduled_today()]
+    # Get statistics: one aggregate query instead of two COUNTs
+    routine_counts = Routine.objects.aggregate(
+        total=Count("pk"), active=Count("pk", filter=Q(enabled=True))
+    )
+    total_routines = routine_counts["total"]
+    active_routines_count = routine_counts["active"]
+    active_routines = Routine.objects.filter(enabled=True)
+
+    # Get routines scheduled for today: the weekday-bit test and the
+    # one-time date match both run in SQL, so only matching rows come back
+    # instead of filtering every enabled routine in Python
+    today = timezone.localdate()
+    routines_today = list(
+        active_routines.annotate(
+            today_flag=F("days_mask").bitand(1 << today.weekday())
+        ).filter(
+            Q(schedule_type="recurring", today_flag__gt=0)
+            | Q(schedule_type="once", scheduled_datetime__date=today)
+        )
+    )
 
-    # Get recent execution logs
-    recent_logs = RoutineLog.objects.select_related("routine").order_by(
-        "-started_at"
-    )[:10]
+    # Get recent execution logs: index-backed 10-row scan, narrowed to
+    # the columns the dashboard renders
+    recent_logs = (
+        RoutineLog.objects.select_related("routine")
+        .only("id", "status", "started_at", "completed_at", "routine__name")
+        .order_by("-started_at")[:10]
+    )
 
     # Total executions
     total_executions = RoutineLog.objects.count()
@@ -98,9 +124,12 @@ class RoutineDetailView(DetailView):
     def get_context_data(self, **kwargs):
         context = super().get_context_data(**kwargs)
 
-        # Get execution logs for this routine
+        # Get execution logs for this routine; the (routine, -started_at)
+        # index serves the ORDER BY + LIMIT, and only the columns the
+        # template renders come back
         context["logs"] = (
             RoutineLog.objects.filter(routine=self.object)
+            .only("id", "status", "started_at", "completed_at", "error_message")
             .order_by("-started_at")[:20]
         )
 
@@ -123,9 +152,8 @@ class RoutineCreateView(CreateView):
         response = super().form_valid(form)
         messages.success(self.request, f"Routine '{self.object.name}' created successfully!")
 
-        # Reload scheduler to pick up new routine
-        from .scheduler import schedule_routine
-        schedule_routine(self.object)
+        # Rebuild schedules on a worker; repeated edits coalesce into one task
+        request_schedule_reload()
 
         return response
 
@@ -146,9 +174,8 @@ class RoutineUpdateView(UpdateView):
         response = super().form_valid(form)
         messages.success(self.request, f"Routine '{self.object.name}' updated successfully!")
 
-        # Reload scheduler to pick up changes
-        from .scheduler import schedule_routine
-        schedule_routine(self.object)
+        # Rebuild schedules on a worker; repeated edits coalesce into one task
+        request_schedule_reload()
 
         return response
 
@@ -167,7 +194,6 @@ class RoutineDeleteView(DeleteView):
         routine_id = routine.id
 
         # Remove from scheduler
-        from .scheduler import remove_routine_schedule
         remove_routine_schedule(routine_id)
 
         response = super().delete(request, *args, **kwargs)
@@ -185,11 +211,17 @@ def routine_toggle(request, pk):
         routine.enabled = not routine.enabled
         routine.save()
 
-        from .scheduler import schedule_routine, remove_routine_schedule
+        # Both branches enqueue the schedule mutation so the redirect
+        # doesn't block on django_q_schedule writes; enabling goes through
+        # the coalesced full reload, disabling is a targeted removal
         if routine.enabled:
-            schedule_routine(routine)
+            request_schedule_reload()
         else:
-            remove_routine_schedule(routine.id)
+            async_task(
+                "alarm_app.scheduler.remove_routine_schedule",
+                routine.id,
+                group="schedule_mutation",
+            )
 
         status = "enabled" if routine.enabled else "disabled"
         messages.success(request, f"Routine '{routine.name}' {status}.")
@@ -214,19 +246,30 @@ def settings_view(request):
     else:
         form = UserProfileForm(instance=profile)
 
-    from django_q.models import Schedule
     scheduler_running = True  # Django-Q is always "running" if installed
-    scheduled_jobs_count = Schedule.objects.filter(name__startswith='routine_').count()
+
+    def _collect_counts():
+        from django_q.models import Schedule
+
+        return {
+            "quote_count": Quote.objects.filter(active=True).count(),
+            "news_source_count": NewsSource.objects.filter(active=True).count(),
+            "location_count": WeatherLocation.objects.count(),
+            "audio_count": AudioFile.objects.count(),
+            "scheduled_jobs_count": Schedule.objects.filter(
+                name__startswith='routine_'
+            ).count(),
+            "total_executions": RoutineLog.objects.count(),
+        }
+
+    # Six cross-table COUNTs; cached briefly so refreshes don't reissue
+    # a round-trip per table
+    counts = cache.get_or_set("settings_counts", _collect_counts, 30)
 
     context = {
         "form": form,
-        "quote_count": Quote.objects.filter(active=True).count(),
-        "news_source_count": NewsSource.objects.filter(active=True).count(),
-        "location_count": WeatherLocation.objects.count(),
-        "audio_count": AudioFile.objects.count(),
         "scheduler_running": scheduler_running,
-        "scheduled_jobs_count": scheduled_jobs_count,
-        "total_executions": RoutineLog.objects.count(),
+        **counts,
     }
 
     return render(request, "alarm_app/settings.html", context)
@@ -10,6 +10,8 @@ For the full list of settings and their values, see
 https://docs.djangoproject.com/en/5.0/ref/settings/
 """
 
+import multiprocessing
+
 from pathlib import Path
 
 # Build paths inside the project like this: BASE_DIR / 'subdir'.
@@ -58,7 +60,9 @@ INSTALLED_APPS = [
 
 Q_CLUSTER = {
     'name': 'smart_alarm',
-    'workers': 1,
+    # Size the pool from the machine instead of pinning to one worker,
+    # which serialized long routines behind each other
+    'workers': multiprocessing.cpu_count(),
     'timeout': 600,
     'retry': 3600,
     'queue_limit': 50,
@@ -75,7 +79,6 @@ MIDDLEWARE = [
     "django.contrib.messages.middleware.MessageMiddleware",
     "django.middleware.clickjacking.XFrameOptionsMiddleware",
     "whitenoise.middleware.WhiteNoiseMiddleware",
-    "alarm_app.middleware.SchedulerMiddleware",
 ]
 
 ROOT_URLCONF = "config.urls"
@@ -84,8 +87,18 @@ TEMPLATES = [
     {
         "BACKEND": "django.template.backends.django.DjangoTemplates",
         "DIRS": [],
-        "APP_DIRS": True,
         "OPTIONS": {
+            # Cache compiled templates per process instead of re-reading
+            # them from disk on every render
+            "loaders": [
+                (
+                    "django.template.loaders.cached.Loader",
+                    [
+                        "django.template.loaders.filesystem.Loader",
+                        "django.template.loaders.app_directories.Loader",
+                    ],
+                ),
+            ],
             "context_processors": [
                 "django.template.context_processors.debug",
                 "django.template.context_processors.request",
@@ -76,7 +76,7 @@ setup_python_env() {
     cd "$INSTALL_DIR"
     python3 -m venv .venv
     source .venv/bin/activate
-    pip install croniter django django_q2 feedparser requests google-images-downloader gunicorn whitenoise
+    pip install croniter django django_q2 fastjsonschema feedparser orjson requests google-images-downloader gunicorn whitenoise
     log_success "Python environment configured"
 }
 